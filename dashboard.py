@@ -1,35 +1,45 @@
+import os
 import sqlite3
 import pandas as pd
 import streamlit as st
 
 DB_FILE = "scan_results.db"
 TABLE = "stock_scans"
+# Pages only read; the scan in run_scan.py is the sole writer
+DB_URI = f"file:{DB_FILE}?mode=ro"
 
 st.set_page_config(layout="wide")
 st.title("📊 AI Stock Research Dashboard")
 st.caption("Ideas • Strategies • Portfolio Simulation")
 
 # =============================
-# LOAD LATEST SCAN
+# LOAD TOP IDEAS FROM LATEST SCAN
 # =============================
+# db_mtime only keys the cache, so a finished scan is picked up immediately
 @st.cache_data(ttl=300)
-def load_latest():
-    conn = sqlite3.connect(DB_FILE)
+def load_top_ideas(top_n, db_mtime):
+    conn = sqlite3.connect(DB_URI, uri=True)
     df = pd.read_sql(
         f"""
-        SELECT *
+        SELECT
+            ticker,
+            buy_sharpe,
+            mom_sharpe,
+            (MAX(buy_sharpe, 0) / 2) * 0.4
+                + (MAX(mom_sharpe, 0) / 2) * 0.3 AS idea_score
         FROM {TABLE}
         WHERE scan_timestamp = (
             SELECT MAX(scan_timestamp) FROM {TABLE}
         )
+        ORDER BY idea_score DESC
+        LIMIT ?
         """,
-        conn
+        conn,
+        params=(top_n,)
     )
     conn.close()
     return df
 
-df = load_latest()
-
 # =============================
 # NAVIGATION
 # =============================
@@ -54,28 +64,21 @@ st.subheader("🔥 Top Ideas")
 
 top_n = st.slider("Number of ideas", 3, 15, 5)
 
-top_df = df.copy()
-
-top_df["idea_score"] = (
-    (top_df["buy_sharpe"].clip(lower=0) / 2) * 0.4 +
-    (top_df["mom_sharpe"].clip(lower=0) / 2) * 0.3
-)
-
-top_df = top_df.sort_values("idea_score", ascending=False).head(top_n)
+top_df = load_top_ideas(top_n, os.path.getmtime(DB_FILE))
 
 def open_stock(ticker):
     st.session_state.selected_stock = ticker
     st.switch_page("pages/3_Stock_Research.py")
 
-for _, row in top_df.iterrows():
+for row in top_df.itertuples(index=False):
     c1, c2, c3 = st.columns([2, 1, 1])
 
     with c1:
-        if st.button(row["ticker"], key=f"idea_{row['ticker']}"):
-            open_stock(row["ticker"])
+        if st.button(row.ticker, key=f"idea_{row.ticker}"):
+            open_stock(row.ticker)
 
     with c2:
-        st.write(f"BUY Sharpe: {row['buy_sharpe']}")
+        st.write(f"BUY Sharpe: {row.buy_sharpe}")
 
     with c3:
-        st.write(f"Mom Sharpe: {row['mom_sharpe']}")
+        st.write(f"Mom Sharpe: {row.mom_sharpe}")
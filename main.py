@@ -58,6 +58,35 @@ def momentum_signal_from_row(row):
     return "BUY" if (row["SMA_50"] > row["SMA_200"] and row["RSI"] > 50) else "HOLD"
 
 
+def compute_signals(df):
+    """
+    Vectorized equivalent of buy_signal_from_row, momentum_signal_from_row
+    and the unified BUY / SELL / HOLD signal, in one pass over the columns.
+    NaN comparisons are False, which gives the same HOLD fallback.
+    """
+    df = df.copy()
+
+    close = df["Close"].to_numpy()
+    sma50 = df["SMA_50"].to_numpy()
+    sma200 = df["SMA_200"].to_numpy()
+    rsi = df["RSI"].to_numpy()
+
+    buy = (close > sma200) & (rsi < 40)
+    mom = (sma50 > sma200) & (rsi > 50)
+    breakdown = (close < sma200) & (sma50 < sma200)
+    euphoria = rsi > 75
+
+    df["BUY"] = np.where(buy, "BUY", "HOLD")
+    df["MOM"] = np.where(mom, "BUY", "HOLD")
+    df["SIGNAL"] = np.select(
+        [buy | mom, breakdown | euphoria],
+        ["BUY", "SELL"],
+        default="HOLD"
+    )
+
+    return df
+
+
 # =====================================================
 # FUNDAMENTALS
 # =====================================================
@@ -130,19 +159,26 @@ def build_portfolio_equity_curve(
     initial_capital,
     start_date
 ):
-    frames = []
+    tickers = list(tickers)
+    if len(tickers) == 0:
+        raise RuntimeError("No usable price data")
+
+    # One batched download (threaded inside yfinance) instead of one per ticker
+    data = yf.download(tickers, start=start_date, progress=False)
+
+    if data is None or data.shape[0] == 0:
+        raise RuntimeError("No usable price data")
+
+    prices = data["Close"]
+    if isinstance(prices, pd.Series):
+        prices = prices.to_frame(tickers[0])
 
-    for t in tickers:
-        try:
-            df = fetch_data(t, start=start_date)[["Close"]]
-            frames.append(df.rename(columns={"Close": t}))
-        except Exception:
-            continue
+    # Tickers that failed to download come back as all-NaN columns
+    prices = prices.dropna(axis=1, how="all")
 
-    if len(frames) == 0:
+    if prices.shape[1] == 0:
         raise RuntimeError("No usable price data")
 
-    prices = pd.concat(frames, axis=1)
     prices = prices.dropna()
 
     if prices.shape[0] == 0:
@@ -150,12 +186,11 @@ def build_portfolio_equity_curve(
 
     norm = prices / prices.iloc[0]
 
-    equity = pd.Series(0.0, index=norm.index)
+    # Non-numeric, missing or non-positive weights contribute nothing
+    w = pd.to_numeric(pd.Series(weights, dtype=object), errors="coerce")
+    w = w.reindex(norm.columns).fillna(0.0).clip(lower=0.0)
 
-    for t in norm.columns:
-        w = weights.get(t, 0.0)
-        if isinstance(w, (int, float)) and w > 0:
-            equity = equity.add(norm[t] * (initial_capital * w), fill_value=0)
+    equity = norm.dot(w * initial_capital)
 
     cash_weight = 1.0 - float(sum(weights.values()))
     if cash_weight > 0:
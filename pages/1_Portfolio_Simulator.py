@@ -1,5 +1,7 @@
+import os
 import sqlite3
 import pandas as pd
+import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
 from datetime import date
@@ -8,6 +10,8 @@ from main import build_portfolio_equity_curve
 
 DB_FILE = "scan_results.db"
 TABLE = "stock_scans"
+# Pages only read; the scan in run_scan.py is the sole writer
+DB_URI = f"file:{DB_FILE}?mode=ro"
 
 st.set_page_config(layout="wide")
 st.title("🧪 Portfolio Simulator")
@@ -26,9 +30,10 @@ def fmt_date(d):
 # =============================
 # LOAD DATA
 # =============================
+# db_mtime only keys the cache, so a finished scan is picked up immediately
 @st.cache_data(ttl=300)
-def load_latest():
-    conn = sqlite3.connect(DB_FILE)
+def load_latest(db_mtime):
+    conn = sqlite3.connect(DB_URI, uri=True)
     df = pd.read_sql(
         f"""
         SELECT *
@@ -43,7 +48,7 @@ def load_latest():
     return df
 
 
-df = load_latest()
+df = load_latest(os.path.getmtime(DB_FILE))
 
 # =============================
 # INPUTS
@@ -70,16 +75,10 @@ start_date = st.date_input(
 # =============================
 df = df.sort_values("buy_sharpe", ascending=False)
 
-weights = []
-remaining = 1.0
-
-for _ in df.itertuples():
-    if remaining <= 0:
-        weights.append(0)
-    else:
-        w = min(max_weight / 100, remaining)
-        weights.append(w)
-        remaining -= w
+# Greedy fill: each stock takes max_weight until capital runs out
+cap = max_weight / 100
+weights = np.clip(1.0 - np.arange(len(df)) * cap, 0.0, cap)
+remaining = max(0.0, 1.0 - len(df) * cap)
 
 df["weight"] = weights
 df = df[df["weight"] > 0]
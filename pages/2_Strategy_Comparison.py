@@ -1,16 +1,20 @@
+import os
 import sqlite3
 import pandas as pd
 import streamlit as st
 
 DB_FILE = "scan_results.db"
 TABLE = "stock_scans"
+# Pages only read; the scan in run_scan.py is the sole writer
+DB_URI = f"file:{DB_FILE}?mode=ro"
 
 st.set_page_config(layout="wide")
 st.title("⚖️ Strategy Comparison Dashboard")
 
+# db_mtime only keys the cache, so a finished scan is picked up immediately
 @st.cache_data(ttl=300)
-def load_latest():
-    conn = sqlite3.connect(DB_FILE)
+def load_latest(db_mtime):
+    conn = sqlite3.connect(DB_URI, uri=True)
     df = pd.read_sql(
         f"""
         SELECT * FROM {TABLE}
@@ -23,7 +27,7 @@ def load_latest():
     conn.close()
     return df
 
-df = load_latest()
+df = load_latest(os.path.getmtime(DB_FILE))
 
 # =============================
 # SUMMARY
@@ -49,18 +53,18 @@ def open_stock(ticker):
     st.session_state.selected_stock = ticker
     st.switch_page("pages/3_Stock_Research.py")
 
-for _, row in df.iterrows():
+for row in df.itertuples(index=False):
     c1, c2, c3, c4 = st.columns([2, 1, 1, 1])
 
     with c1:
-        if st.button(row["ticker"], key=f"str_{row['ticker']}"):
-            open_stock(row["ticker"])
+        if st.button(row.ticker, key=f"str_{row.ticker}"):
+            open_stock(row.ticker)
 
     with c2:
-        st.write(f"BUY Sharpe: {row['buy_sharpe']}")
+        st.write(f"BUY Sharpe: {row.buy_sharpe}")
 
     with c3:
-        st.write(f"Mom Sharpe: {row['mom_sharpe']}")
+        st.write(f"Mom Sharpe: {row.mom_sharpe}")
 
     with c4:
-        st.write(f"DD: {row['buy_max_dd']}%")
+        st.write(f"DD: {row.buy_max_dd}%")
@@ -1,3 +1,4 @@
+import os
 import sqlite3
 import pandas as pd
 import streamlit as st
@@ -6,14 +7,15 @@ import plotly.graph_objects as go
 from main import (
     fetch_data,
     compute_indicators,
-    buy_signal_from_row,
-    momentum_signal_from_row,
+    compute_signals,
     fetch_fundamentals,
     conservative_dcf,
 )
 
 DB_FILE = "scan_results.db"
 TABLE = "stock_scans"
+# Pages only read; the scan in run_scan.py is the sole writer
+DB_URI = f"file:{DB_FILE}?mode=ro"
 
 st.set_page_config(layout="wide")
 st.title("🔍 Stock Research")
@@ -22,18 +24,18 @@ st.caption("Technicals • Fundamentals • Valuation • Signals")
 # =============================
 # LOAD ALL AVAILABLE STOCKS
 # =============================
+# db_mtime only keys the cache, so a finished scan is picked up immediately
 @st.cache_data(ttl=600)
-def load_all_tickers():
-    conn = sqlite3.connect(DB_FILE)
-    df = pd.read_sql(
-        f"SELECT DISTINCT ticker FROM {TABLE} ORDER BY ticker",
-        conn
-    )
+def load_all_tickers(db_mtime):
+    conn = sqlite3.connect(DB_URI, uri=True)
+    rows = conn.execute(
+        f"SELECT DISTINCT ticker FROM {TABLE} ORDER BY ticker"
+    ).fetchall()
     conn.close()
-    return df["ticker"].tolist()
+    return [r[0] for r in rows]
 
 
-all_tickers = load_all_tickers()
+all_tickers = load_all_tickers(os.path.getmtime(DB_FILE))
 
 if not all_tickers:
     st.error("No stocks found in cache. Run scan first.")
@@ -49,16 +51,35 @@ ticker = st.selectbox(
 )
 
 # =============================
-# LOAD & SANITIZE PRICE DATA
+# CACHED NETWORK LOADERS
 # =============================
-try:
-    raw_df = fetch_data(ticker, period="3y")
+@st.cache_data(ttl=600)
+def load_price_data(ticker):
+    df = fetch_data(ticker, period="3y")
 
     # Flatten Yahoo MultiIndex columns
-    if isinstance(raw_df.columns, pd.MultiIndex):
-        raw_df.columns = raw_df.columns.get_level_values(0)
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+
+    # compute_indicators and everything downstream only read Close
+    return df[["Close"]]
+
+
+@st.cache_data(ttl=600)
+def load_fundamentals(ticker):
+    return fetch_fundamentals(ticker)
+
+
+@st.cache_data(ttl=600)
+def load_dcf(ticker, price):
+    return conservative_dcf(ticker, price)
 
-    raw_df = raw_df[["Open", "High", "Low", "Close", "Volume"]]
+
+# =============================
+# LOAD & SANITIZE PRICE DATA
+# =============================
+try:
+    raw_df = load_price_data(ticker)
 
 except Exception as e:
     st.error(f"Failed to load price data: {e}")
@@ -70,109 +91,101 @@ except Exception as e:
 price_df = compute_indicators(raw_df)
 
 # =============================
-# STRATEGY SIGNALS
+# STRATEGY + UNIFIED BUY / SELL / HOLD SIGNALS
 # =============================
-price_df["BUY"] = price_df.apply(buy_signal_from_row, axis=1)
-price_df["MOM"] = price_df.apply(momentum_signal_from_row, axis=1)
-
-# =============================
-# UNIFIED BUY / SELL / HOLD
-# =============================
-def unified_signal(row):
-    # BUY: strategy-driven
-    if row["BUY"] == "BUY" or row["MOM"] == "BUY":
-        return "BUY"
-
-    # SELL: trend breakdown
-    if (
-        row["Close"] < row["SMA_200"]
-        and row["SMA_50"] < row["SMA_200"]
-    ):
-        return "SELL"
-
-    # SELL: euphoria
-    if row["RSI"] > 75:
-        return "SELL"
-
-    return "HOLD"
-
-
-
-price_df["SIGNAL"] = price_df.apply(unified_signal, axis=1)
+# BUY: either strategy fires
+# SELL: trend breakdown (Close & SMA 50 below SMA 200) or euphoria (RSI > 75)
+price_df = compute_signals(price_df)
+
+# Indicator math is done in float64; store/plot/hash at half the width
+price_df = price_df.astype({
+    "Close": "float32",
+    "SMA_50": "float32",
+    "SMA_200": "float32",
+    "RSI": "float32",
+})
 
 latest = price_df.iloc[-1]
 
 # =============================
 # FUNDAMENTALS + DCF
 # =============================
-fundamentals = fetch_fundamentals(ticker)
-dcf = conservative_dcf(ticker, latest["Close"])
+fundamentals = load_fundamentals(ticker)
+dcf = load_dcf(ticker, float(latest["Close"]))
 
 # =============================
 # PRICE CHART + SIGNALS
 # =============================
 st.subheader("📈 Price, Trend & Signals")
 
-fig = go.Figure()
-
-fig.add_trace(go.Scatter(
-    x=price_df.index,
-    y=price_df["Close"],
-    name="Close",
-    line=dict(width=2)
-))
-
-fig.add_trace(go.Scatter(
-    x=price_df.index,
-    y=price_df["SMA_50"],
-    name="SMA 50",
-    line=dict(dash="dot")
-))
-
-fig.add_trace(go.Scatter(
-    x=price_df.index,
-    y=price_df["SMA_200"],
-    name="SMA 200",
-    line=dict(dash="dash")
-))
-
-buy_df = price_df[price_df["SIGNAL"] == "BUY"]
-sell_df = price_df[price_df["SIGNAL"] == "SELL"]
-
-fig.add_trace(go.Scatter(
-    x=buy_df.index,
-    y=buy_df["Close"],
-    mode="markers",
-    name="BUY",
-    marker=dict(color="green", size=9, symbol="triangle-up")
-))
-
-fig.add_trace(go.Scatter(
-    x=sell_df.index,
-    y=sell_df["Close"],
-    mode="markers",
-    name="SELL",
-    marker=dict(color="red", size=9, symbol="triangle-down")
-))
-
-fig.update_layout(
-    height=450,
-    xaxis_title="Date",
-    yaxis_title="Price"
-)
+# Cached so widget reruns reuse the figure instead of rebuilding every trace
+@st.cache_data(ttl=600)
+def build_price_chart(price_df):
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=price_df.index,
+        y=price_df["Close"],
+        name="Close",
+        line=dict(width=2)
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=price_df.index,
+        y=price_df["SMA_50"],
+        name="SMA 50",
+        line=dict(dash="dot")
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=price_df.index,
+        y=price_df["SMA_200"],
+        name="SMA 200",
+        line=dict(dash="dash")
+    ))
+
+    buy_df = price_df[price_df["SIGNAL"] == "BUY"]
+    sell_df = price_df[price_df["SIGNAL"] == "SELL"]
+
+    fig.add_trace(go.Scatter(
+        x=buy_df.index,
+        y=buy_df["Close"],
+        mode="markers",
+        name="BUY",
+        marker=dict(color="green", size=9, symbol="triangle-up")
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=sell_df.index,
+        y=sell_df["Close"],
+        mode="markers",
+        name="SELL",
+        marker=dict(color="red", size=9, symbol="triangle-down")
+    ))
+
+    fig.update_layout(
+        height=450,
+        xaxis_title="Date",
+        yaxis_title="Price"
+    )
+
+    return fig
 
-st.plotly_chart(fig, use_container_width=True)
+
+st.plotly_chart(build_price_chart(price_df), use_container_width=True)
 
 # =============================
 # CURRENT SIGNAL
 # =============================
 st.subheader("🚦 Current Signal")
 
-signal_icon = {
+SIGNAL_ICONS = {
     "BUY": "🟢",
     "HOLD": "⚪",
     "SELL": "🔴"
-}[latest["SIGNAL"]]
+}
+
+signal_icon = SIGNAL_ICONS[latest["SIGNAL"]]
 
 st.markdown(f"### {signal_icon} **{latest['SIGNAL']}**")
 
@@ -181,18 +194,24 @@ st.markdown(f"### {signal_icon} **{latest['SIGNAL']}**")
 # =============================
 st.subheader("📉 RSI")
 
-fig_rsi = go.Figure()
-fig_rsi.add_trace(go.Scatter(
-    x=price_df.index,
-    y=price_df["RSI"],
-    name="RSI"
-))
+@st.cache_data(ttl=600)
+def build_rsi_chart(price_df):
+    fig_rsi = go.Figure()
+    fig_rsi.add_trace(go.Scatter(
+        x=price_df.index,
+        y=price_df["RSI"],
+        name="RSI"
+    ))
+
+    fig_rsi.add_hline(y=70, line_dash="dash")
+    fig_rsi.add_hline(y=30, line_dash="dash")
+
+    fig_rsi.update_layout(height=260, yaxis_title="RSI")
+
+    return fig_rsi
 
-fig_rsi.add_hline(y=70, line_dash="dash")
-fig_rsi.add_hline(y=30, line_dash="dash")
 
-fig_rsi.update_layout(height=260, yaxis_title="RSI")
-st.plotly_chart(fig_rsi, use_container_width=True)
+st.plotly_chart(build_rsi_chart(price_df), use_container_width=True)
 
 # =============================
 # FUNDAMENTALS
@@ -240,10 +259,7 @@ reasons.append(
 )
 
 reasons.append(
-    ("Unified signal: " + latest["SIGNAL"],
-     "🟢" if latest["SIGNAL"] == "BUY"
-     else "🔴" if latest["SIGNAL"] == "SELL"
-     else "⚪")
+    ("Unified signal: " + latest["SIGNAL"], signal_icon)
 )
 
 for text, icon in reasons:
@@ -1,3 +1,6 @@
+import os
+import json
+import time
 import sqlite3
 import pandas as pd
 import logging
@@ -19,6 +22,9 @@ MAX_WORKERS = 6
 
 LOG_FILE = "scan.log"
 
+NIFTY50_CACHE = "nifty50_cache.json"
+NIFTY50_CACHE_TTL = 24 * 60 * 60  # constituents rarely change
+
 # =============================
 # LOGGING
 # =============================
@@ -50,27 +56,61 @@ FALLBACK_NIFTY50 = [
     "UPL.NS","WIPRO.NS"
 ]
 
+def load_cached_nifty50():
+    """
+    Returns the cached symbol list if it is fresh, else None.
+    """
+    try:
+        if time.time() - os.path.getmtime(NIFTY50_CACHE) > NIFTY50_CACHE_TTL:
+            return None
+        with open(NIFTY50_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_nifty50(symbols):
+    """
+    Writes via a temp file so a crash never leaves a half-written cache.
+    """
+    tmp = NIFTY50_CACHE + ".tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(symbols, f)
+        os.replace(tmp, NIFTY50_CACHE)
+    except OSError as e:
+        log.warning(f"Could not write NIFTY 50 cache | {e}")
+
 def fetch_nifty50():
     """
-    Tries NSE website.
+    Uses the on-disk cache if it is less than a day old.
+    Otherwise tries NSE website.
     Falls back safely if NSE blocks or times out.
     """
+    symbols = load_cached_nifty50()
+    if symbols:
+        log.info(f"Using cached NIFTY 50 list: {len(symbols)} stocks")
+        return symbols
+
     url = "https://www.niftyindices.com/IndexConstituent/ind_nifty50list.csv"
     try:
         log.info("Fetching NIFTY 50 from NSE")
         df = pd.read_csv(url)
         symbols = [s.strip() + ".NS" for s in df["Symbol"].tolist()]
         log.info(f"NSE fetch successful: {len(symbols)} stocks")
-        return symbols
     except Exception as e:
         log.warning(f"NSE fetch failed, using fallback list | {e}")
         return FALLBACK_NIFTY50
 
+    save_cached_nifty50(symbols)
+    return symbols
+
 # =============================
 # DB
 # =============================
 def init_db():
     conn = sqlite3.connect(DB_FILE)
+    # WAL is persistent on the file: dashboard reads don't block scan writes
+    conn.execute("PRAGMA journal_mode=WAL")
     conn.execute(f"""
         CREATE TABLE IF NOT EXISTS {TABLE} (
             ticker TEXT,
@@ -85,27 +125,49 @@ def init_db():
             scan_timestamp TEXT
         )
     """)
+    conn.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_{TABLE}_ticker
+        ON {TABLE} (ticker, scan_timestamp)
+    """)
+    conn.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_{TABLE}_scan_ts
+        ON {TABLE} (scan_timestamp)
+    """)
     conn.commit()
     conn.close()
 
+COLUMNS = [
+    "ticker", "price", "RSI",
+    "buy_sharpe", "buy_return_pct", "buy_max_dd",
+    "mom_sharpe", "mom_return_pct", "mom_max_dd",
+    "scan_timestamp",
+]
+
 def save(df):
+    # Missing columns become NULL, as with to_sql; NaN is stored as NULL
+    rows = list(df.reindex(columns=COLUMNS).itertuples(index=False, name=None))
     conn = sqlite3.connect(DB_FILE)
-    df.to_sql(TABLE, conn, if_exists="append", index=False)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    with conn:
+        conn.executemany(
+            f"INSERT INTO {TABLE} ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(COLUMNS))})",
+            rows
+        )
     conn.close()
 
 # =============================
 # SCAN
 # =============================
-def scan_batch(symbols):
+def scan_batch(symbols, ex):
     results = []
-    with ThreadPoolExecutor(MAX_WORKERS) as ex:
-        futures = {ex.submit(analyze_stock, s): s for s in symbols}
-        for f in as_completed(futures):
-            sym = futures[f]
-            try:
-                results.append(f.result())
-            except Exception as e:
-                log.error(f"Failed: {sym} | {e}")
+    futures = {ex.submit(analyze_stock, s): s for s in symbols}
+    for f in as_completed(futures):
+        sym = futures[f]
+        try:
+            results.append(f.result())
+        except Exception as e:
+            log.error(f"Failed: {sym} | {e}")
     return results
 
 # =============================
@@ -126,11 +188,13 @@ if __name__ == "__main__":
     batches = ceil(total / BATCH_SIZE)
     log.info(f"Starting scan | {total} stocks | {batches} batches")
 
-    for i in range(batches):
-        batch = symbols[i * BATCH_SIZE:(i + 1) * BATCH_SIZE]
-        log.info(f"Scanning batch {i+1}/{batches}")
-        batch_results = scan_batch(batch)
-        all_results.extend(batch_results)
+    # One pool for the whole scan; worker threads are reused across batches
+    with ThreadPoolExecutor(MAX_WORKERS) as ex:
+        for i in range(batches):
+            batch = symbols[i * BATCH_SIZE:(i + 1) * BATCH_SIZE]
+            log.info(f"Scanning batch {i+1}/{batches}")
+            batch_results = scan_batch(batch, ex)
+            all_results.extend(batch_results)
 
     if not all_results:
         raise RuntimeError("Scan failed completely")